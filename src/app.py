@@ -1,14 +1,17 @@
-import os
+from pathlib import Path
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QEventLoop, QSettings, QTimer
 from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import (
-        QApplication, QFrame, QGridLayout, QHBoxLayout, QTabWidget, QVBoxLayout, QWidget)
+        QApplication, QButtonGroup, QFrame, QGridLayout, QHBoxLayout, QTabWidget, QVBoxLayout,
+        QWidget)
 
-from .constants import CAREERS, FACTIONS, PRIMARY_SPECS, SECONDARY_SPECS
+from .constants import (
+        CAREERS_WITH_EMPTY, FACTIONS_WITH_EMPTY, PRIMARY_SPECS_WITH_EMPTY,
+        SECONDARY_SPECS_WITH_EMPTY)
 from .iofunc import create_folder, get_asset_path, load_icon
 from .widgetbuilder import AHCENTER, ALEFT, ARIGHT, ATOP, AVCENTER, SMAXMIN, SMINMAX, SMINMIN
-from .widgets import Cache, ImageLabel, WidgetStorage
+from .widgets import Cache, CachedSettings, ImageLabel, WidgetStorage
 
 # only for developing; allows to terminate the qt event loop with keyboard interrupt
 from signal import signal, SIGINT, SIG_DFL
@@ -24,13 +27,13 @@ class SETS():
             create_button, create_button_series, create_combo_box, create_entry, create_frame,
             create_label)
 
-    app_dir = None
+    app_dir: Path
 
     versions = ('', '')  # (release version, dev version)
 
     config = {}  # see main.py for contents
 
-    settings: QSettings  # see main.py for defaults
+    settings: CachedSettings  # see main.py for defaults
 
     # stores widgets that need to be accessed from outside their creating function
     widgets: WidgetStorage
@@ -38,6 +41,9 @@ class SETS():
     # stores refined cargo data
     cache: Cache
 
+    # stores style sheets created by get_style_class, keyed by (class name, theme key)
+    style_cache: dict
+
     def __init__(self, theme, args, path, config, versions):
         """
         Creates new Instance of SETS
@@ -52,17 +58,17 @@ class SETS():
         self.versions = versions
         self.theme = theme
         self.args = args
-        self.app_dir = path
+        self.app_dir = Path(path).resolve()
         self.config = config
         self.widgets = WidgetStorage()
         self.cache = Cache()
+        self.style_cache = dict()
         self.init_settings()
         self.init_config()
         self.init_environment()
         self.app, self.window = self.create_main_window()
         self.setup_main_layout()
-        self.window.show()
-        self.init_backend()
+        QTimer.singleShot(0, self.init_backend)
 
     def run(self) -> int:
         """
@@ -76,35 +82,35 @@ class SETS():
         """
         Prepares settings. Loads stored settings. Saves current settings for next startup.
         """
-        settings_path = os.path.abspath(self.app_dir + self.config['settings_path'])
-        self.settings = QSettings(settings_path, QSettings.Format.IniFormat)
+        settings_path = str(self.app_dir / self.config['settings_path'].lstrip('/\\'))
+        self.settings = CachedSettings(settings_path, QSettings.Format.IniFormat)
         for setting, value in self.config['default_settings'].items():
             if self.settings.value(setting, None) is None:
                 self.settings.setValue(setting, value)
+        self.settings.sync()
 
     def init_config(self):
         """
         Prepares config.
         """
-        config_folder = os.path.abspath(
-                self.app_dir + self.config['config_folder_path'])
-        self.config['config_folder_path'] = config_folder
-        for folder, path in self.config['config_subfolders'].items():
-            self.config['config_subfolders'][folder] = config_folder + path
-        self.config['ui_scale'] = self.settings.value('ui_scale', type=float)
-        self.config['box_width'] *= self.config['ui_scale']
-        self.config['box_height'] *= self.config['ui_scale']
+        config_folder = self.app_dir / self.config['config_folder_path'].lstrip('/\\')
+        self.config['config_folder_path'] = str(config_folder)
+        self.config['config_subfolders'] = {
+            folder: str(config_folder / path.lstrip('/\\'))
+            for folder, path in self.config['config_subfolders'].items()
+        }
+        ui_scale = self.settings.value('ui_scale', value_type=float)
+        self.config['ui_scale'] = ui_scale
+        self.config['box_width'] *= ui_scale
+        self.config['box_height'] *= ui_scale
 
     def init_environment(self):
         """
         Creates required folders if necessary.
         """
         create_folder(self.config['config_folder_path'])
-        create_folder(self.config['config_subfolders']['library'])
-        create_folder(self.config['config_subfolders']['cache'])
-        create_folder(self.config['config_subfolders']['backups'])
-        create_folder(self.config['config_subfolders']['images'])
-        create_folder(self.config['config_subfolders']['ship_images'])
+        for folder_path in self.config['config_subfolders'].values():
+            create_folder(folder_path)
 
     def main_window_close_callback(self, event):
         """
@@ -112,6 +118,7 @@ class SETS():
         """
         window_geometry = self.window.saveGeometry()
         self.settings.setValue('geometry', window_geometry)
+        self.settings.sync()
         event.accept()
 
     # ----------------------------------------------------------------------------------------------
@@ -125,10 +132,11 @@ class SETS():
         :return: QApplication, QWidget
         """
         app = QApplication(argv)
-        font_database = QFontDatabase()
-        font_database.addApplicationFont(get_asset_path('Overpass-Bold.ttf', self.app_dir))
-        font_database.addApplicationFont(get_asset_path('Overpass-Medium.ttf', self.app_dir))
-        font_database.addApplicationFont(get_asset_path('Overpass-Regular.ttf', self.app_dir))
+        for font_file in ('Overpass-Bold.ttf', 'Overpass-Medium.ttf', 'Overpass-Regular.ttf'):
+            font_path = get_asset_path(font_file, self.app_dir)
+            if font_path != '':
+                with open(font_path, 'rb') as file:
+                    QFontDatabase.addApplicationFontFromData(file.read())
         app.setStyleSheet(self.create_style_sheet(self.theme['app']['style']))
         window = QWidget()
         window.setWindowIcon(load_icon('SETS_icon_small.png', self.app_dir))
@@ -140,7 +148,8 @@ class SETS():
 
     def setup_main_layout(self):
         """
-        Creates the main layout and places it into the main window.
+        Creates the main layout and places it into the main window. Shows the main window with the
+        splash screen selected.
         """
         # master layout: banner, borders and splash screen
         layout = QVBoxLayout()
@@ -155,12 +164,15 @@ class SETS():
         main_layout.setSpacing(0)
         banner = ImageLabel(get_asset_path('sets_banner.png', self.app_dir), (2880, 126))
         main_layout.addWidget(banner)
+        # tabbers share the same style sheets, so they are only built once
+        tabber_style = self.get_style_class('QTabWidget', 'tabber')
+        tabber_tab_style = self.get_style_class('QTabBar', 'tabber_tab')
         tabber_layout = QVBoxLayout()
         tabber_layout.setContentsMargins(8, 8, 8, 8)
         tabber_layout.setSpacing(0)
         splash_tabber = QTabWidget()
-        splash_tabber.setStyleSheet(self.get_style_class('QTabWidget', 'tabber'))
-        splash_tabber.tabBar().setStyleSheet(self.get_style_class('QTabBar', 'tabber_tab'))
+        splash_tabber.setStyleSheet(tabber_style)
+        splash_tabber.tabBar().setStyleSheet(tabber_tab_style)
         splash_tabber.setSizePolicy(SMINMIN)
         self.widgets.splash_tabber = splash_tabber
         tabber_layout.addWidget(splash_tabber)
@@ -172,6 +184,9 @@ class SETS():
         splash_tabber.addTab(splash_frame, 'Splash')
         self.setup_splash(splash_frame)
 
+        # the splash screen stays visible until the backend is loaded
+        self.enter_splash()
+
         content_layout = QGridLayout()
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(0)
@@ -194,20 +209,18 @@ class SETS():
         menu_layout.addLayout(self.create_button_series(left_button_group), 0, 0, ALEFT | ATOP)
         center_button_group = {
             'default': {'font': ('Overpass', 16, 'medium')},
-            'SPACE': {'callback': lambda: self.switch_main_tab(0), 'stretch': 1, 'size': SMINMAX},
-            'GROUND': {'callback': lambda: self.switch_main_tab(1), 'stretch': 1, 'size': SMINMAX},
-            'SPACE SKILLS': {
-                'callback': lambda: self.switch_main_tab(2),
-                'stretch': 1,
-                'size': SMINMAX
-            },
-            'GROUND SKILLS': {
-                'callback': lambda: self.switch_main_tab(3),
-                'stretch': 1,
-                'size': SMINMAX
-            }
+            'SPACE': {'stretch': 1, 'size': SMINMAX},
+            'GROUND': {'stretch': 1, 'size': SMINMAX},
+            'SPACE SKILLS': {'stretch': 1, 'size': SMINMAX},
+            'GROUND SKILLS': {'stretch': 1, 'size': SMINMAX}
         }
-        center_buttons = self.create_button_series(center_button_group, 'heavy_button')
+        center_buttons, center_button_list = self.create_button_series(
+                center_button_group, 'heavy_button', ret=True)
+        # button id is the index of the tab the button switches to
+        center_button_ids = QButtonGroup(self.window)
+        for tab_index, button in enumerate(center_button_list):
+            center_button_ids.addButton(button, tab_index)
+        center_button_ids.idClicked.connect(self.switch_main_tab)
         menu_layout.addLayout(center_buttons, 0, 1)
         right_button_group = {
             'Export': {'callback': lambda: None},
@@ -224,8 +237,8 @@ class SETS():
         sidebar_layout.setSpacing(0)
 
         sidebar_tabber = QTabWidget()
-        sidebar_tabber.setStyleSheet(self.get_style_class('QTabWidget', 'tabber'))
-        sidebar_tabber.tabBar().setStyleSheet(self.get_style_class('QTabBar', 'tabber_tab'))
+        sidebar_tabber.setStyleSheet(tabber_style)
+        sidebar_tabber.tabBar().setStyleSheet(tabber_tab_style)
         sidebar_tabber.setSizePolicy(SMINMIN)
         self.widgets.sidebar_tabber = sidebar_tabber
         sidebar_tab_names = (
@@ -234,18 +247,11 @@ class SETS():
             tab_frame = self.create_frame()
             sidebar_tabber.addTab(tab_frame, tab_name)
             self.widgets.sidebar_frames.append(tab_frame)
-        space_frame = self.create_frame()
-        ground_frame = self.create_frame()
-        ground_skill_frame = self.create_frame()
-        sidebar_tabber.addTab(space_frame, 'space')
-        sidebar_tabber.addTab(ground_frame, 'ground')
-        sidebar_tabber.addTab(ground_skill_frame, 'ground_skill')
-        self.widgets.sidebar_frames = [space_frame, ground_frame, ground_skill_frame]
         sidebar_layout.addWidget(sidebar_tabber, 0, 0)
 
         character_tabber = QTabWidget()
-        character_tabber.setStyleSheet(self.get_style_class('QTabWidget', 'tabber'))
-        character_tabber.tabBar().setStyleSheet(self.get_style_class('QTabBar', 'tabber_tab'))
+        character_tabber.setStyleSheet(tabber_style)
+        character_tabber.tabBar().setStyleSheet(tabber_tab_style)
         character_tabber.setSizePolicy(SMINMAX)
         self.widgets.character_tabber = character_tabber
         char_frame = self.create_frame()
@@ -267,8 +273,8 @@ class SETS():
 
         # build section
         build_tabber = QTabWidget()
-        build_tabber.setStyleSheet(self.get_style_class('QTabWidget', 'tabber'))
-        build_tabber.tabBar().setStyleSheet(self.get_style_class('QTabBar', 'tabber_tab'))
+        build_tabber.setStyleSheet(tabber_style)
+        build_tabber.tabBar().setStyleSheet(tabber_tab_style)
         build_tabber.setSizePolicy(SMINMIN)
         self.widgets.build_tabber = build_tabber
         build_tab_names = (
@@ -281,6 +287,8 @@ class SETS():
         content_layout.addWidget(build_tabber, 1, 1)
 
         content_frame.setLayout(content_layout)
+        self.window.show()
+        QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
 
     def setup_character_frame(self, frame: QFrame):
         """
@@ -298,27 +306,27 @@ class SETS():
         career_label = self.create_label('Captain Career', 'label_subhead')
         layout.addWidget(career_label, 1, 0, alignment=ARIGHT)
         career_combo = self.create_combo_box()
-        career_combo.addItems({''} | CAREERS)
+        career_combo.addItems(CAREERS_WITH_EMPTY)
         layout.addWidget(career_combo, 1, 1)
         faction_label = self.create_label('Faction')
         layout.addWidget(faction_label, 2, 0, alignment=ARIGHT)
         faction_combo = self.create_combo_box()
-        faction_combo.addItems({''} | FACTIONS)
+        faction_combo.addItems(FACTIONS_WITH_EMPTY)
         layout.addWidget(faction_combo, 2, 1)
         species_label = self.create_label('Species')
         layout.addWidget(species_label, 3, 0, alignment=ARIGHT)
         species_combo = self.create_combo_box()
-        species_combo.addItems({''})
+        species_combo.addItems(('',))
         layout.addWidget(species_combo, 3, 1)
         primary_label = self.create_label('Primary Spec')
         layout.addWidget(primary_label, 4, 0, alignment=ARIGHT)
         primary_combo = self.create_combo_box()
-        primary_combo.addItems({''} | PRIMARY_SPECS)
+        primary_combo.addItems(PRIMARY_SPECS_WITH_EMPTY)
         layout.addWidget(primary_combo, 4, 1)
         secondary_label = self.create_label('Secondary Spec')
         layout.addWidget(secondary_label, 5, 0, alignment=ARIGHT)
         secondary_combo = self.create_combo_box()
-        secondary_combo.addItems({''} | SECONDARY_SPECS)
+        secondary_combo.addItems(SECONDARY_SPECS_WITH_EMPTY)
         layout.addWidget(secondary_combo, 5, 1)
         frame.setLayout(layout)
 
@@ -51,4 +51,10 @@ PRIMARY_SPECS = {'Command', 'Intelligence', 'Miracle Worker', 'Temporal', 'Pilot
 
 SECONDARY_SPECS = {'Strategist', 'Constable', 'Commando'}
 
+# sorted combo box contents with leading empty item
+CAREERS_WITH_EMPTY = ('',) + tuple(sorted(CAREERS))
+FACTIONS_WITH_EMPTY = ('',) + tuple(sorted(FACTIONS))
+PRIMARY_SPECS_WITH_EMPTY = ('',) + tuple(sorted(PRIMARY_SPECS))
+SECONDARY_SPECS_WITH_EMPTY = ('',) + tuple(sorted(SECONDARY_SPECS))
+
 BOFF_URL = WIKI_URL + 'Bridge_officer_and_kit_abilities'
@@ -7,7 +7,7 @@ from PySide6.QtCore import QThread, Signal
 from requests.exceptions import Timeout
 from requests_html import Element
 
-from .callbacks import enter_splash, exit_splash, splash_text
+from .callbacks import exit_splash, splash_text
 from .constants import (
         BOFF_URL, CAREERS, DOFF_QUERY_URL, EQUIPMENT_TYPES, FACTION_QUERY, ITEM_QUERY_URL,
         PRIMARY_SPECS, SHIP_QUERY_URL, STARSHIP_TRAIT_QUERY_URL, TRAIT_QUERY_URL, WIKI_IMAGE_URL)
@@ -36,10 +36,10 @@ class CustomThread(QThread):
         out of scope and be destroyed by the garbage collector
         - :param func: function to execute in seperate thread, must take parameter `thread`
         """
+        super().__init__(parent)
         self._func = func
         self._args = args
         self._kwargs = kwargs
-        super().__init__(parent)
 
     def run(self):
         self._func(*self._args, thread=self, **self._kwargs)
@@ -53,7 +53,6 @@ def init_backend(self):
         if cargo_thread.isFinished() and build_ready:
             exit_splash(self)
 
-    enter_splash(self)
     build_ready = True
     cargo_thread = CustomThread(self.window, populate_cache, self)
     cargo_thread.update_splash.connect(lambda new_text: splash_text(self, new_text))
@@ -238,7 +237,7 @@ def get_boff_data(self):
     Populates self.cache.boff_abilities until boff abilties are available from cargo
     """
     filename = 'boff_abilities.json'
-    filepath = f"{self.config['config_subfolders']['cache']}\\{filename}"
+    filepath = os.path.join(self.config['config_subfolders']['cache'], filename)
 
     # try loading from cache
     if os.path.exists(filepath) and os.path.isfile(filepath):
@@ -248,7 +247,8 @@ def get_boff_data(self):
                 self.cache.boff_abilities = load_json(filepath)
                 return
             except JSONDecodeError:
-                backup_filepath = f"{self.config['config_subfolders']['backups']}\\{filename}"
+                backup_filepath = os.path.join(
+                        self.config['config_subfolders']['backups'], filename)
                 if os.path.exists(backup_filepath) and os.path.isfile(backup_filepath):
                     try:
                         cargo_data = load_json(backup_filepath)
@@ -1,6 +1,7 @@
 from datetime import datetime
 import json
 import os
+from pathlib import Path
 from re import sub as re_sub
 import sys
 from urllib.parse import quote_plus
@@ -24,7 +25,7 @@ def get_cargo_data(self, filename: str, url: str, ignore_cache_age=False) -> dic
     - :param url: url to cargo table
     - :param ignore_cache_age: True if cache of any age should be accepted
     """
-    filepath = f"{self.config['config_subfolders']['cache']}\\{filename}"
+    filepath = os.path.join(self.config['config_subfolders']['cache'], filename)
     cargo_data = None
 
     # try loading from cache
@@ -34,7 +35,8 @@ def get_cargo_data(self, filename: str, url: str, ignore_cache_age=False) -> dic
             try:
                 return load_json(filepath)
             except json.JSONDecodeError:
-                backup_filepath = f"{self.config['config_subfolders']['backups']}\\{filename}"
+                backup_filepath = os.path.join(
+                        self.config['config_subfolders']['backups'], filename)
                 if os.path.exists(backup_filepath) and os.path.isfile(backup_filepath):
                     try:
                         cargo_data = load_json(backup_filepath)
@@ -71,7 +73,7 @@ def retrieve_image(
     - :param url_override: non default image url (optional)
     """
     filename = get_image_file_name(name)
-    filepath = f'{image_folder_path}\\{filename}'
+    filepath = os.path.join(image_folder_path, filename)
     image = QPixmap(filepath)
     if image.isNull():
         if signal is not None:
@@ -119,11 +121,10 @@ def create_folder(path_to_folder):
     Parameters:
     - :path_to_folder: absolute path to folder
     """
-    if not os.path.exists(path_to_folder) and not os.path.isdir(path_to_folder):
-        os.mkdir(path_to_folder)
+    os.makedirs(path_to_folder, exist_ok=True)
 
 
-def get_asset_path(asset_name: str, app_directory: str) -> str:
+def get_asset_path(asset_name: str, app_directory: Path) -> str:
     """
     returns the absolute path to a file in the asset folder
 
@@ -138,7 +139,7 @@ def get_asset_path(asset_name: str, app_directory: str) -> str:
         return ''
 
 
-def load_icon(filename: str, app_directory: str) -> QIcon:
+def load_icon(filename: str, app_directory: Path) -> QIcon:
     """
     Loads icon from path and returns it.
 
@@ -45,6 +45,9 @@ def get_style_class(self, class_name: str, widget, override={}) -> str:
 
     :return: str containing css style sheet
     """
+    # style sheets without override only depend on class_name and widget
+    if len(override) == 0 and (class_name, widget) in self.style_cache:
+        return self.style_cache[(class_name, widget)]
     if widget is None or widget == '':
         style = override
     elif widget != 'app' and widget != 'defaults' and widget != 's.c' and widget in self.theme:
@@ -62,6 +65,8 @@ def get_style_class(self, class_name: str, widget, override={}) -> str:
             main += f''' {class_name}{k} {{{get_css(self, v)}}}'''
         elif k.startswith('~'):
             main += f' {get_style_class(self, f"{class_name} {k[1:]}", None, v)}'
+    if len(override) == 0:
+        self.style_cache[(class_name, widget)] = main
     return main
 
 
@@ -1,9 +1,9 @@
-from PySide6.QtCore import QRect
-from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtCore import QRect, QSettings, Qt, QTimer
+from PySide6.QtGui import QPainter, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QFrame, QLabel, QTabWidget, QWidget
 
+from .constants import EQUIPMENT_TYPES
 from .widgetbuilder import SMINMIN
-from .datafunctions import EQUIPMENT_TYPES
 
 
 class WidgetStorage():
@@ -23,6 +23,60 @@ class WidgetStorage():
         self.character_frames: list[QFrame] = list()
 
 
+class CachedSettings():
+    """
+    Wraps QSettings; keeps all values in memory and writes changed values on `sync()`.
+    """
+    def __init__(self, path: str, settings_format: QSettings.Format):
+        self._settings = QSettings(path, settings_format)
+        self._values: dict = {key: self._settings.value(key) for key in self._settings.allKeys()}
+        self._changed: set = set()
+
+    def value(self, key: str, default=None, value_type=None):
+        """
+        Returns setting `key` or `default` if it is not set or stored as None. Only approximates
+        `QSettings.value`: with `value_type` given, strings are converted to bool ('true' is True)
+        or passed to `value_type` (int also accepts float strings like '1.0'); values that cannot
+        be converted return `default`.
+
+        Parameters:
+        - :param key: name of the setting
+        - :param default: returned if the setting is missing or cannot be converted (optional)
+        - :param value_type: type the setting is converted to (optional)
+        """
+        value = self._values.get(key)
+        if value is None:
+            return default
+        if value_type is None or isinstance(value, value_type):
+            return value
+        if value_type is bool and isinstance(value, str):
+            return value.lower() == 'true'
+        try:
+            if value_type is int and isinstance(value, str):
+                return int(float(value))
+            return value_type(value)
+        except (TypeError, ValueError):
+            return default
+
+    def setValue(self, key: str, value):
+        """
+        Sets setting `key` to `value`; the change is written to disk on the next `sync()`.
+        """
+        self._values[key] = value
+        self._changed.add(key)
+
+    def sync(self):
+        """
+        Writes changed settings to disk.
+        """
+        if len(self._changed) == 0:
+            return
+        for key in self._changed:
+            self._settings.setValue(key, self._values[key])
+        self._settings.sync()
+        self._changed.clear()
+
+
 class Cache():
     """
     Stores data
@@ -88,6 +142,11 @@ class ImageLabel(QWidget):
     def __init__(self, path: str, aspect_ratio: tuple[int, int], *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._w, self._h = aspect_ratio
+        self._painted_width = 0
+        # repaints smoothly once the width stopped changing
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self.update)
         self.setPixmap(QPixmap(path))
         self.setSizePolicy(SMINMIN)
         self.setMinimumHeight(10)  # forces visibility
@@ -98,11 +157,26 @@ class ImageLabel(QWidget):
 
     def paintEvent(self, event):
         if not self.p.isNull():
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
             w = int(self.rect().width())
             h = int(w * self._h / self._w)
-            rect = QRect(0, 0, w, h)
-            painter.drawPixmap(rect, self.p)
-            self.setMaximumHeight(h)
-            self.setMinimumHeight(h)
+            dpr = self.devicePixelRatioF()
+            # scaled pixmap is cached per source pixmap, size and device pixel ratio
+            cache_key = f'{self.p.cacheKey()}:{w}x{h}@{dpr}'
+            scaled_pixmap = QPixmapCache.find(cache_key)
+            painter = QPainter(self)
+            if scaled_pixmap is not None:
+                painter.drawPixmap(0, 0, scaled_pixmap)
+            elif w != self._painted_width:
+                # width is changing (e.g. while resizing the window) -> fast scaling for now
+                painter.drawPixmap(QRect(0, 0, w, h), self.p)
+                self._smooth_timer.start(80)
+            else:
+                scaled_pixmap = self.p.scaled(
+                        round(w * dpr), round(h * dpr), Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation)
+                scaled_pixmap.setDevicePixelRatio(dpr)
+                QPixmapCache.insert(cache_key, scaled_pixmap)
+                painter.drawPixmap(0, 0, scaled_pixmap)
+            self._painted_width = w
+            if self.height() != h:
+                self.setFixedHeight(h)